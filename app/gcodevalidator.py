@@ -0,0 +1,629 @@
+'''
+Created on 19 oct. 2026
+
+@author: mdelu
+'''
+import math
+import operator
+import re
+from collections import namedtuple
+from functools import reduce
+from itertools import accumulate, islice
+
+# Number after a G-code letter, captured without the spaces before it
+NUMBER = r'[ \t]*([-+]?(?:\d+\.?\d*|\.\d+))'
+# One G-code word: letter followed by a number (e.g. "G1", "X-12.5", "S1000")
+WORD_RE = re.compile(r'([A-Z])' + NUMBER)
+VALUE_RES = {letter: re.compile(letter + NUMBER) for letter in 'XY'}
+# Comments in parentheses, e.g. "(Start of file: part.nc)", and after ";"
+COMMENT_RE = re.compile(r'\([^)\n]*\)')
+SEMICOLON_COMMENT_RE = re.compile(r';[^\n]*')
+# Any G word other than G0/G1, and any M word. Lines without one of these
+# only move in a straight line and set S/F, see GCodeValidator.check_text.
+# The G pattern lists what is not 0 or 1 (G2, G10, G1.5, ...) instead of
+# using a lookahead, which is several times faster to scan for
+MODAL_G_RE = re.compile(r'G[ \t]*(?:[-+]|0*(?:[2-9]|1\d|[01]?\.\d*[1-9]))')
+M_WORD_RE = re.compile('M' + NUMBER)
+
+# Commands understood by GRBL 1.1 based laser/plotter controllers
+DEFAULT_SUPPORTED_G = frozenset([
+    0, 1, 2, 3, 4, 10, 17, 18, 19, 20, 21, 28, 28.1, 30, 30.1,
+    38.2, 38.3, 38.4, 38.5, 40, 43.1, 49, 53, 54, 55, 56, 57, 58, 59,
+    61, 80, 90, 91, 91.1, 92, 92.1, 93, 94,
+])
+# plus M300, the beep this program inserts between files
+DEFAULT_SUPPORTED_M = frozenset([0, 1, 2, 3, 4, 5, 7, 8, 9, 30, 56, 300])
+
+# G codes whose X/Y words are not a plain work position on the bed
+NO_BOUNDS_G = frozenset([4, 10, 28, 30, 53, 92])
+
+# Rounding left by inch conversion and arc maths, a move that touches the
+# bed edge must not be reported as outside
+BOUNDS_TOLERANCE = 1e-6
+
+ERROR = 'error'
+WARNING = 'warning'
+
+# Stop reporting a rule for a file after this many hits, a single wrong
+# offset would otherwise produce one finding per line of the file
+MAX_FINDINGS_PER_RULE = 10
+
+# Laser jobs repeat the same short lines ("S0", "M5", "G0 F3000") thousands
+# of times, so parsed lines without coordinates are cached up to this many
+# distinct lines. Coordinate lines rarely repeat and would only fill the cache
+PARSE_CACHE_SIZE = 4096
+
+# Runs shorter than this many characters (a few lines, e.g. between the
+# arcs of a job of circles) are cheaper to check line by line than to scan
+# with the bulk patterns
+MIN_BULK_RUN = 256
+
+Finding = namedtuple('Finding', ['filename', 'line', 'severity', 'rule', 'message'])
+
+
+def format_finding(finding):
+    return (f"{finding.filename}:{finding.line}: {finding.severity}: "
+            f"[{finding.rule}] {finding.message}")
+
+
+def parse_line(line):
+    '''
+    Split a line into (g_codes, m_codes, x, y, i, j, r, power, feed).
+
+    G and M codes are lists of (number, text) pairs, power and feed are
+    (number, text) pairs or None. Lines without words return EMPTY_LINE.
+    '''
+    # Like GRBL, a ";" inside parentheses is part of that comment
+    code = line
+    if '(' in code:
+        code = COMMENT_RE.sub('', code)
+    code = code.split(';', 1)[0]
+    words = WORD_RE.findall(code.upper())
+    if not words:
+        return EMPTY_LINE
+
+    g_codes = []
+    m_codes = []
+    x = y = i = j = r = power = feed = None
+    for letter, value in words:
+        if letter == 'G':
+            g_codes.append((float(value), value))
+        elif letter == 'M':
+            m_codes.append((float(value), value))
+        elif letter == 'X':
+            x = float(value)
+        elif letter == 'Y':
+            y = float(value)
+        elif letter == 'I':
+            i = float(value)
+        elif letter == 'J':
+            j = float(value)
+        elif letter == 'R':
+            r = float(value)
+        elif letter == 'S':
+            power = (float(value), value)
+        elif letter == 'F':
+            feed = (float(value), value)
+    return g_codes, m_codes, x, y, i, j, r, power, feed
+
+
+EMPTY_LINE = ((), (), None, None, None, None, None, None, None)
+
+
+def radius_to_center(start_x, start_y, end_x, end_y, radius, clockwise):
+    '''
+    Centre offset (I, J) of an R format arc, worked out the way GRBL does.
+    Returns None when no arc of that radius joins the two points.
+    '''
+    x = end_x - start_x
+    y = end_y - start_y
+    h_squared = 4 * radius * radius - x * x - y * y
+    if h_squared < 0 or (x == 0 and y == 0):
+        return None
+    h = -math.sqrt(h_squared) / math.hypot(x, y)
+    if not clockwise:
+        h = -h
+    if radius < 0:
+        h = -h
+    return 0.5 * (x - y * h), 0.5 * (y + x * h)
+
+
+def arc_extent(start_x, start_y, end_x, end_y, center_x, center_y, clockwise):
+    '''
+    Bounding box (min_x, max_x, min_y, max_y) of an arc, including the
+    quadrant points it sweeps through. Start equal to end is a full circle.
+    '''
+    radius = math.hypot(start_x - center_x, start_y - center_y)
+    start_angle = math.atan2(start_y - center_y, start_x - center_x)
+    end_angle = math.atan2(end_y - center_y, end_x - center_x)
+    if clockwise:
+        start_angle, end_angle = end_angle, start_angle
+    sweep = (end_angle - start_angle) % math.tau
+    if sweep == 0:
+        sweep = math.tau
+
+    xs = [start_x, end_x]
+    ys = [start_y, end_y]
+    for quadrant, (dx, dy) in enumerate(((1, 0), (0, 1), (-1, 0), (0, -1))):
+        if (quadrant * math.pi / 2 - start_angle) % math.tau <= sweep:
+            xs.append(center_x + dx * radius)
+            ys.append(center_y + dy * radius)
+    return min(xs), max(xs), min(ys), max(ys)
+
+
+_limit_patterns = {}
+
+
+def limit_patterns(letter, limit, sign):
+    '''
+    Compiled (above_re, equal_re) for `letter` words of the given sign
+    ('' or '-') compared to a magnitude limit >= 1.
+
+    above_re finds words whose integer part alone puts them above the limit
+    (more digits, or a higher digit where they first differ). equal_re
+    captures the words with the limit's integer part, the only ones whose
+    value has to be converted.
+    '''
+    integer = str(int(limit))
+    key = (letter, integer, sign)
+    patterns = _limit_patterns.get(key)
+    if patterns is None:
+        digits = len(integer)
+        above = [r'[1-9]\d{%d}' % digits]
+        for place, digit in enumerate(integer):
+            if digit != '9':
+                above.append(r'%s[%d-9]\d{%d}' % (integer[:place], int(digit) + 1, digits - place - 1))
+        prefix = letter + r'[ \t]*' + (r'-0*' if sign == '-' else r'\+?0*')
+        patterns = (re.compile(prefix + r'(?:%s)' % '|'.join(above)),
+                    re.compile(prefix + r'(' + integer + r'(?:\.\d*)?)'))
+        _limit_patterns[key] = patterns
+    return patterns
+
+
+def first_magnitude_above(letter, sign, text, start, end, limit):
+    '''
+    Position of the first `letter` word in text[start:end] with the given
+    sign and a magnitude above limit, or -1. Numbers are only converted
+    when their integer part is the limit's, so a clean run of S500 under
+    a S1000 limit is a single regex search.
+    '''
+    if limit < 1:
+        # The digit patterns need a limit of at least 1
+        value_re = re.compile(letter + r'[ \t]*' + ('-' if sign == '-' else r'\+?')
+                              + r'(\d+\.?\d*|\.\d+)')
+        for match in value_re.finditer(text, start, end):
+            if float(match.group(1)) > limit:
+                return match.start()
+        return -1
+
+    above_re, equal_re = limit_patterns(letter, limit, sign)
+    above = above_re.search(text, start, end)
+    stop = above.start() if above else end
+    for match in equal_re.finditer(text, start, stop):
+        if float(match.group(1)) > limit:
+            return match.start()
+    return stop if above else -1
+
+
+def first_value_outside(letter, text, start, end, low, high):
+    '''
+    Position of the first `letter` word in text[start:end] with a value
+    below low or above high, or -1.
+    '''
+    if low <= 0 <= high:
+        above = first_magnitude_above(letter, '', text, start, end, high)
+        if above != -1:
+            end = above
+        below = first_magnitude_above(letter, '-', text, start, end, -low)
+        return below if below != -1 else above
+
+    # Limits that leave out zero (an origin moved off the bed) are rare,
+    # every value is converted
+    for match in VALUE_RES[letter].finditer(text, start, end):
+        value = float(match.group(1))
+        if value < low or value > high:
+            return match.start()
+    return -1
+
+
+def scaled_values(letter, text, start, end, scale):
+    '''Values of the `letter` words in text[start:end], in millimetres.'''
+    return [float(value) * scale for value in VALUE_RES[letter].findall(text, start, end)]
+
+
+def first_relative_outside(letter, text, start, end, position, scale, low, high):
+    '''
+    Position of the first relative `letter` word in text[start:end] that
+    moves from position to below low or above high, or -1.
+    '''
+    moves = scaled_values(letter, text, start, end, scale)
+    if not moves:
+        return -1
+    positions = list(accumulate(moves, initial=position))[1:]
+    if min(positions) >= low and max(positions) <= high:
+        return -1
+    index = next(index for index, value in enumerate(positions) if not low <= value <= high)
+    return next(islice(VALUE_RES[letter].finditer(text, start, end), index, None)).start()
+
+
+def last_value(letter, text, start, end):
+    '''Value of the last `letter` word in text[start:end], or None.'''
+    value_re = VALUE_RES[letter]
+    position = text.rfind(letter, start, end)
+    while position != -1:
+        match = value_re.match(text, position, end)
+        if match:
+            return float(match.group(1))
+        position = text.rfind(letter, start, position)
+    return None
+
+
+class GCodeValidator:
+    '''
+    Rule based checker for a combined job.
+
+    Each file is checked from the text already read to write the combined
+    file, so validating does not read the files again. The machine state
+    (position, laser, distance mode and units) is carried from one file to
+    the next, like it is on the machine. A limit set to None disables its
+    rule.
+
+    Bed bounds cover the whole path of G2/G3 arcs and follow G92 offsets.
+    The machine's stored values are unknown here, so G54-G59 work
+    coordinates are taken to match the machine origin, and G28/G30 are
+    taken to return to it. Only X and Y are checked.
+    '''
+
+    def __init__(self, bed_width=None, bed_height=None, max_power=1000,
+                 max_feed=None, supported_g=DEFAULT_SUPPORTED_G,
+                 supported_m=DEFAULT_SUPPORTED_M):
+        self.bed_width = bed_width
+        self.bed_height = bed_height
+        self.max_power = max_power
+        self.max_feed = max_feed
+        self.supported_g = supported_g
+        self.supported_m = supported_m
+
+        self.findings = []
+        self.lines_checked = 0
+
+        self.x = 0.0
+        self.y = 0.0
+        self.offset_x = 0.0  # G92 offsets
+        self.offset_y = 0.0
+        self.motion = 0  # modal motion mode, G0 to G3
+        self.relative = False
+        self.inches = False
+        self.laser_on = None  # (filename, line, command) of the last M3/M4
+        self._laser_reported = False
+
+        self._filename = None
+        self._rule_counts = {}
+        self._first_finding = 0
+        self._parse_cache = {}
+
+    def report(self, line, severity, rule, message):
+        count = self._rule_counts.get(rule, 0) + 1
+        self._rule_counts[rule] = count
+        if count <= MAX_FINDINGS_PER_RULE:
+            self.findings.append(Finding(self._filename, line, severity, rule, message))
+
+    def start_file(self, filename):
+        self._filename = filename
+        self._rule_counts = {}
+        self._first_finding = len(self.findings)
+
+    def end_file(self, last_line):
+        # Checking stops once a rule goes past its cap, so the number of
+        # occurrences left is not known
+        for rule, count in self._rule_counts.items():
+            if count > MAX_FINDINGS_PER_RULE:
+                self.findings.append(Finding(
+                    self._filename, last_line, WARNING, rule,
+                    "more occurrences not shown"))
+
+        # Modal state still active here leaks into the next file. The laser
+        # is reported once, against the file whose M3/M4 turned it on
+        if self.laser_on is not None and not self._laser_reported:
+            filename, line, command = self.laser_on
+            self.findings.append(Finding(
+                filename, line, ERROR, 'modal-laser',
+                f"laser left on by {command}, missing M5 before the end of the file"))
+            self._laser_reported = True
+        if self.relative:
+            self.findings.append(Finding(
+                self._filename, last_line, WARNING, 'modal-distance',
+                "file ends in relative mode (G91), next file will move relative"))
+        if self.inches:
+            self.findings.append(Finding(
+                self._filename, last_line, WARNING, 'modal-units',
+                "file ends in inch units (G20), next file will run in inches"))
+
+        # End of file findings point back to earlier lines (the M3 left on),
+        # keep the file's findings in line order
+        file_findings = self.findings[self._first_finding:]
+        file_findings.sort(key=operator.attrgetter('line'))
+        self.findings[self._first_finding:] = file_findings
+        self._filename = None
+
+    def check_text(self, text, filename):
+        '''
+        Validate the whole text of one file.
+
+        Lines with a modal word (see MODAL_G_RE) go through check_line.
+        The runs of plain G0/G1 lines between them are checked in bulk by
+        check_run, so a clean job is mostly scanned by the regex engine
+        instead of line by line.
+
+        Absolute jobs, in mm or inches and with or without G92 offsets,
+        check around 2M lines/s. Relative (G91) runs convert every X/Y
+        value to add up the position, around 1M lines/s. Arcs and the
+        short runs between them are checked line by line, around 0.4M
+        lines/s for a job made of circles.
+        '''
+        self.start_file(filename)
+        line_count = text.count('\n')
+        if text and not text.endswith('\n'):
+            line_count += 1
+
+        if '(' in text:
+            text = COMMENT_RE.sub('', text)
+        if ';' in text:
+            text = SEMICOLON_COMMENT_RE.sub('', text)
+        text = text.upper()
+
+        modal_words = [match.start() for match in MODAL_G_RE.finditer(text)]
+        if 'M' in text:
+            modal_words.extend(match.start() for match in M_WORD_RE.finditer(text))
+            modal_words.sort()
+
+        position = 0
+        line_number = 1
+        for word_start in modal_words:
+            line_start = text.rfind('\n', 0, word_start) + 1
+            if line_start < position:
+                continue  # another word of a line already checked
+            line_end = text.find('\n', line_start)
+            if line_end == -1:
+                line_end = len(text)
+            self.check_run(text, position, line_start, line_number)
+            line_number += text.count('\n', position, line_start)
+            self.check_line(text[line_start:line_end], line_number)
+            position = line_end + 1
+            line_number += 1
+        self.check_run(text, position, len(text), line_number)
+
+        self.lines_checked += line_count
+        self.end_file(line_count)
+
+    def check_run(self, text, start, end, first_line):
+        '''
+        Check text[start:end], lines starting at first_line without any
+        modal word. Long runs of straight moves are checked by
+        check_run_bulk, runs in arc mode and short runs line by line.
+        '''
+        if start >= end:
+            return
+        linear = self.motion != 2 and self.motion != 3
+        if linear and end - start >= MIN_BULK_RUN:
+            self.check_run_bulk(text, start, end, first_line)
+            return
+        if text[end - 1] == '\n':
+            end -= 1
+        for line_number, line in enumerate(text[start:end].split('\n'), first_line):
+            self.check_line(line, line_number)
+
+    def check_run_bulk(self, text, start, end, first_line):
+        '''
+        Check a run with regex searches. The lines before the first word a
+        rule may report on only move the machine, that word's line goes
+        through check_line and the search carries on after it.
+
+        Searches cover a window that doubles while the text is clean, so a
+        cluster of problems does not rescan the rest of the run each time.
+        '''
+        window = MIN_BULK_RUN
+        while start < end:
+            stop = end
+            if end - start > window:
+                stop = text.rfind('\n', start, start + window) + 1 or end
+            problem = self.first_problem(text, start, stop)
+            if problem == -1:
+                self.move_through(text, start, stop)
+                first_line += text.count('\n', start, stop)
+                start = stop
+                window *= 2
+                continue
+            window = MIN_BULK_RUN
+            line_start = max(start, text.rfind('\n', start, problem) + 1)
+            line_end = text.find('\n', problem, end)
+            if line_end == -1:
+                line_end = end
+            self.move_through(text, start, line_start)
+            first_line += text.count('\n', start, line_start)
+            self.check_line(text[line_start:line_end], first_line)
+            first_line += 1
+            start = line_end + 1
+
+    def rule_active(self, rule, limit):
+        # A rule past its cap reports nothing more in this file
+        return limit is not None and self._rule_counts.get(rule, 0) <= MAX_FINDINGS_PER_RULE
+
+    def first_problem(self, text, start, end):
+        '''Position of the first word in text[start:end] a rule may report, or -1.'''
+        problem = -1
+        if self.rule_active('power-limit', self.max_power):
+            found = first_magnitude_above('S', '', text, start, end, self.max_power)
+            if found != -1:
+                problem = end = found
+        if self.rule_active('feed-limit', self.max_feed):
+            found = first_magnitude_above('F', '', text, start, end, self.max_feed)
+            if found != -1:
+                problem = end = found
+        if self.rule_active('bed-bounds', self.bed_width):
+            found = self.first_outside_bed('X', text, start, end, self.x, self.offset_x, self.bed_width)
+            if found != -1:
+                problem = end = found
+        if self.rule_active('bed-bounds', self.bed_height):
+            found = self.first_outside_bed('Y', text, start, end, self.y, self.offset_y, self.bed_height)
+            if found != -1:
+                problem = end = found
+        return problem
+
+    def first_outside_bed(self, letter, text, start, end, position, offset, size):
+        scale = 25.4 if self.inches else 1.0
+        if self.relative:
+            return first_relative_outside(letter, text, start, end, position, scale,
+                                          -BOUNDS_TOLERANCE, size + BOUNDS_TOLERANCE)
+        # Absolute words are compared in the file's units and coordinates
+        return first_value_outside(letter, text, start, end,
+                                   (-offset - BOUNDS_TOLERANCE) / scale,
+                                   (size - offset + BOUNDS_TOLERANCE) / scale)
+
+    def move_through(self, text, start, end):
+        '''Move to the position the lines in text[start:end] end at.'''
+        scale = 25.4 if self.inches else 1.0
+        if self.relative:
+            self.x = reduce(operator.add, scaled_values('X', text, start, end, scale), self.x)
+            self.y = reduce(operator.add, scaled_values('Y', text, start, end, scale), self.y)
+            return
+        x = last_value('X', text, start, end)
+        y = last_value('Y', text, start, end)
+        if x is not None:
+            self.x = x * scale + self.offset_x
+        if y is not None:
+            self.y = y * scale + self.offset_y
+
+    def check_line(self, line, line_number):
+        parsed = self._parse_cache.get(line)
+        if parsed is None:
+            parsed = parse_line(line)
+            has_coordinates = parsed[2] is not None or parsed[3] is not None
+            if not has_coordinates and len(self._parse_cache) < PARSE_CACHE_SIZE:
+                self._parse_cache[line] = parsed
+        if parsed is EMPTY_LINE:
+            return
+        g_codes, m_codes, x, y, i, j, r, power, feed = parsed
+
+        if power is not None and self.max_power is not None and power[0] > self.max_power:
+            self.report(line_number, ERROR, 'power-limit',
+                        f"S{power[1]} exceeds maximum power S{self.max_power:g}")
+        if feed is not None and self.max_feed is not None and feed[0] > self.max_feed:
+            self.report(line_number, ERROR, 'feed-limit',
+                        f"F{feed[1]} exceeds maximum feed F{self.max_feed:g}")
+
+        program_end = False
+        for m, value in m_codes:
+            if m not in self.supported_m:
+                self.report(line_number, ERROR, 'unsupported-command',
+                            f"unsupported command M{value}")
+            elif m == 3 or m == 4:
+                self.laser_on = (self._filename, line_number, f"M{value}")
+                self._laser_reported = False
+            elif m == 5:
+                self.laser_on = None
+            elif m == 2 or m == 30:
+                program_end = True
+
+        axis_command = None
+        for g, value in g_codes:
+            if g not in self.supported_g:
+                self.report(line_number, ERROR, 'unsupported-command',
+                            f"unsupported command G{value}")
+            elif g == 0 or g == 1 or g == 2 or g == 3:
+                self.motion = g
+            elif g == 90:
+                self.relative = False
+            elif g == 91:
+                self.relative = True
+            elif g == 20:
+                self.inches = True
+            elif g == 21:
+                self.inches = False
+            elif g == 92.1:
+                self.offset_x = self.offset_y = 0.0
+            elif g in NO_BOUNDS_G:
+                axis_command = g
+
+        # GRBL program end runs after the rest of the line and restores
+        # G1, G90 and M5, units (G20/G21) and G92 offsets are kept
+        if program_end:
+            self.laser_on = None
+            self.relative = False
+            self.motion = 1
+
+        if axis_command == 28 or axis_command == 30:
+            self.x = self.y = 0.0
+            return
+        if x is None and y is None:
+            return
+
+        scale = 25.4 if self.inches else 1.0
+        if axis_command == 92:
+            if x is not None:
+                self.offset_x = self.x - x * scale
+            if y is not None:
+                self.offset_y = self.y - y * scale
+            return
+        if axis_command == 53:
+            # Machine coordinates, always absolute and without offsets
+            if x is not None:
+                self.x = x * scale
+            if y is not None:
+                self.y = y * scale
+            self.check_move_bounds(line_number, x, y)
+            return
+        if axis_command is not None:
+            return
+
+        start_x, start_y = self.x, self.y
+        if x is not None:
+            self.x = self.x + x * scale if self.relative else x * scale + self.offset_x
+        if y is not None:
+            self.y = self.y + y * scale if self.relative else y * scale + self.offset_y
+
+        if self.motion == 2 or self.motion == 3:
+            clockwise = self.motion == 2
+            if r is not None:
+                center = radius_to_center(start_x, start_y, self.x, self.y, r * scale, clockwise)
+            else:
+                center = ((i or 0.0) * scale, (j or 0.0) * scale)
+            if center is not None:
+                self.check_arc_bounds(line_number, start_x, start_y,
+                                      start_x + center[0], start_y + center[1], clockwise)
+                return
+        self.check_move_bounds(line_number, x, y)
+
+    def check_arc_bounds(self, line_number, start_x, start_y, center_x, center_y, clockwise):
+        # Most arcs are well inside the bed, the exact extent is only worked
+        # out when the whole circle is not
+        radius = math.hypot(start_x - center_x, start_y - center_y)
+        width = self.bed_width if self.bed_width is not None else math.inf
+        height = self.bed_height if self.bed_height is not None else math.inf
+        if radius <= center_x <= width - radius and radius <= center_y <= height - radius:
+            return
+        self.check_bounds(line_number, *arc_extent(
+            start_x, start_y, self.x, self.y, center_x, center_y, clockwise))
+
+    def check_move_bounds(self, line_number, x, y):
+        # A straight move only checks the axes it names, an axis already
+        # outside was reported by the line that moved it there
+        x_value = self.x if x is not None else None
+        y_value = self.y if y is not None else None
+        self.check_bounds(line_number, x_value, x_value, y_value, y_value)
+
+    def check_bounds(self, line_number, min_x, max_x, min_y, max_y):
+        if self.bed_width is not None and min_x is not None:
+            if min_x < -BOUNDS_TOLERANCE:
+                self.report(line_number, ERROR, 'bed-bounds',
+                            f"X{min_x:g} is outside the bed (0 to {self.bed_width:g})")
+            elif max_x > self.bed_width + BOUNDS_TOLERANCE:
+                self.report(line_number, ERROR, 'bed-bounds',
+                            f"X{max_x:g} is outside the bed (0 to {self.bed_width:g})")
+        if self.bed_height is not None and min_y is not None:
+            if min_y < -BOUNDS_TOLERANCE:
+                self.report(line_number, ERROR, 'bed-bounds',
+                            f"Y{min_y:g} is outside the bed (0 to {self.bed_height:g})")
+            elif max_y > self.bed_height + BOUNDS_TOLERANCE:
+                self.report(line_number, ERROR, 'bed-bounds',
+                            f"Y{max_y:g} is outside the bed (0 to {self.bed_height:g})")
@@ -6,11 +6,14 @@ Created on 31 jul. 2024
 import os
 import sys
 import re
+import argparse
 from PyQt5.QtWidgets import (QApplication, QWidget, QPushButton, QFileDialog, QVBoxLayout, QTableWidget, 
-                             QTableWidgetItem, QHeaderView, QLabel, QCheckBox, QHBoxLayout,QMessageBox)
+                             QTableWidgetItem, QHeaderView, QLabel, QCheckBox, QHBoxLayout,QMessageBox,
+                             QDoubleSpinBox)
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QPixmap, QIcon
 import subprocess
+from gcodevalidator import GCodeValidator, ERROR, format_finding
 
 def parse_gcode_file(file_path):
     max_speed = 0
@@ -34,7 +37,9 @@ def parse_gcode_file(file_path):
         'max_power': max_power
     }
 
-def combine_gcode_files(file_list, output_file, add_beep):
+def combine_gcode_files(file_list, output_file, add_beep, validator=None):
+    # When a validator is given it checks the text read for copying,
+    # so validating does not need a second read of the files
     with open(output_file, 'w') as outfile:
         for i, file_path in enumerate(file_list):
             outfile.write(f"\n(Start of file: {os.path.basename(file_path)})\n")
@@ -43,12 +48,17 @@ def combine_gcode_files(file_list, output_file, add_beep):
                 outfile.write("M300 S440 P500\n")  # Beep at 440Hz for 500ms
             
             with open(file_path, 'r') as infile:
-                outfile.write(infile.read())
+                text = infile.read()
+                outfile.write(text)
+                if validator is not None:
+                    validator.check_text(text, os.path.basename(file_path))
             
             outfile.write(f"\n(End of file: {os.path.basename(file_path)})\n")
             
         if add_beep:  # Add final beep after the last file
             outfile.write("M300 S440 P500\n")  # Beep at 440Hz for 500ms
+    
+    return validator.findings if validator is not None else []
 
 class GCodeAnalyzerCombiner(QWidget):
     def __init__(self):
@@ -85,8 +95,19 @@ class GCodeAnalyzerCombiner(QWidget):
         # self.cb_remove_travel = QCheckBox('Remove traveling to zero')
         checkbox_layout.addWidget(self.cb_add_beep)
         # checkbox_layout.addWidget(self.cb_remove_travel)
+        self.cb_validate = QCheckBox('Validate while combining')
+        self.cb_validate.setChecked(True)
+        checkbox_layout.addWidget(self.cb_validate)
         layout.addLayout(checkbox_layout)
         
+        # Machine limits used by the validator, 0 disables the rule
+        limits_layout = QHBoxLayout()
+        self.sb_bed_width = self.add_limit_box(limits_layout, 'Bed X (mm)', 0)
+        self.sb_bed_height = self.add_limit_box(limits_layout, 'Bed Y (mm)', 0)
+        self.sb_max_power = self.add_limit_box(limits_layout, 'Max S', 1000)
+        self.sb_max_feed = self.add_limit_box(limits_layout, 'Max F', 0)
+        layout.addLayout(limits_layout)
+        
         # Combine button
         self.btn_combine = QPushButton('Combine G-code Files', self)
         self.btn_combine.clicked.connect(self.combine_files)
@@ -96,6 +117,27 @@ class GCodeAnalyzerCombiner(QWidget):
         self.setWindowTitle('G-code File Analyzer and Combiner')
         self.setGeometry(300, 300, 600, 500)
 
+    def add_limit_box(self, layout, label, value):
+        spin_box = QDoubleSpinBox()
+        spin_box.setRange(0, 100000)
+        spin_box.setDecimals(0)
+        spin_box.setValue(value)
+        spin_box.setSpecialValueText('Off')
+        layout.addWidget(QLabel(label))
+        layout.addWidget(spin_box)
+        return spin_box
+
+    def create_validator(self):
+        def limit(spin_box):
+            return spin_box.value() or None
+        
+        return GCodeValidator(
+            bed_width=limit(self.sb_bed_width),
+            bed_height=limit(self.sb_bed_height),
+            max_power=limit(self.sb_max_power),
+            max_feed=limit(self.sb_max_feed)
+        )
+
     def select_files(self):
         self.file_list, _ = QFileDialog.getOpenFileNames(
             self, "Select G-code files to analyze", "",
@@ -137,13 +179,26 @@ class GCodeAnalyzerCombiner(QWidget):
         add_beep = self.cb_add_beep.isChecked()
         # remove_travel = self.cb_remove_travel.isChecked()
         
-        combine_gcode_files(self.file_list, output_file, add_beep)
+        validator = self.create_validator() if self.cb_validate.isChecked() else None
+        
+        findings = combine_gcode_files(self.file_list, output_file, add_beep, validator)
         print(f"Combined G-code file saved as: {output_file}")
         
         msg_box = QMessageBox(self)
-        msg_box.setIcon(QMessageBox.Information)
-        msg_box.setText(f"Combined G-code file saved successfully as:\n{output_file}")
-        msg_box.setWindowTitle("Save Successful")
+        if findings:
+            msg_box.setIcon(QMessageBox.Warning)
+            msg_box.setText(f"Combined G-code file saved as:\n{output_file}\n\n"
+                            f"Validation of {validator.lines_checked} lines found {len(findings)} problem(s), "
+                            f"check them before running the job.")
+            msg_box.setDetailedText("\n".join(format_finding(finding) for finding in findings))
+            msg_box.setWindowTitle("Saved with validation problems")
+        else:
+            msg_box.setIcon(QMessageBox.Information)
+            text = f"Combined G-code file saved successfully as:\n{output_file}"
+            if validator is not None:
+                text += f"\n\nValidated {validator.lines_checked} lines, no problems found."
+            msg_box.setText(text)
+            msg_box.setWindowTitle("Save Successful")
         
         open_folder_button = msg_box.addButton("Open Containing Folder", QMessageBox.ActionRole)
         msg_box.addButton(QMessageBox.Ok)
@@ -163,7 +218,50 @@ class GCodeAnalyzerCombiner(QWidget):
             QMessageBox.warning(self, "Unsupported OS", "Opening the folder is not supported on this operating system.")
 
 
+def run_cli(argv):
+    parser = argparse.ArgumentParser(description='Combine G-code files and validate the combined job.')
+    parser.add_argument('files', nargs='+', help='G-code files to combine, in order')
+    parser.add_argument('-o', '--output', required=True, help='combined output file')
+    parser.add_argument('--beep', action='store_true', help='add beep between codes')
+    parser.add_argument('--no-validate', action='store_true', help='combine without validating')
+    parser.add_argument('--bed', nargs=2, type=float, default=[0, 0], metavar=('X', 'Y'),
+                        help='bed size in mm, 0 disables the axis')
+    parser.add_argument('--max-power', type=float, default=1000, help='maximum S value, 0 disables (default 1000)')
+    parser.add_argument('--max-feed', type=float, default=0, help='maximum F value, 0 disables')
+    args = parser.parse_args(argv)
+    
+    # Same as the GUI spin boxes: 0 turns a limit off, negatives make no sense
+    if min(args.bed) < 0:
+        parser.error('--bed sizes must not be negative')
+    if args.max_power < 0:
+        parser.error('--max-power must not be negative')
+    if args.max_feed < 0:
+        parser.error('--max-feed must not be negative')
+    
+    validator = None
+    if not args.no_validate:
+        bed_width, bed_height = args.bed
+        validator = GCodeValidator(
+            bed_width=bed_width or None,
+            bed_height=bed_height or None,
+            max_power=args.max_power or None,
+            max_feed=args.max_feed or None
+        )
+    
+    findings = combine_gcode_files(args.files, args.output, args.beep, validator)
+    for finding in findings:
+        print(format_finding(finding), file=sys.stderr)
+    if validator is not None:
+        print(f"Validated {validator.lines_checked} lines: {len(findings)} finding(s)")
+    print(f"Combined G-code file saved as: {args.output}")
+    
+    # Non zero exit status so scripts can stop before sending the job
+    return 1 if any(finding.severity == ERROR for finding in findings) else 0
+
 def main():
+    if len(sys.argv) > 1:
+        sys.exit(run_cli(sys.argv[1:]))
+    
     app = QApplication(sys.argv)
     ex = GCodeAnalyzerCombiner()
     ex.show()
@@ -0,0 +1,139 @@
+'''
+Created on 19 oct. 2026
+
+@author: mdelu
+'''
+from gcodevalidator import GCodeValidator, MAX_FINDINGS_PER_RULE, parse_line, EMPTY_LINE
+
+
+def validate(*files, **limits):
+    validator = GCodeValidator(**limits)
+    for filename, text in files:
+        validator.check_text(text, filename)
+    return validator
+
+
+def rules(validator):
+    return [(finding.filename, finding.line, finding.rule) for finding in validator.findings]
+
+
+def test_laser_leak_reported_once_against_its_file():
+    validator = validate(('a.nc', "G21 G90\nM3 S500\nG1 X10 Y10\n"),
+                         ('b.nc', "G1 X20 Y20 S300\nG1 X30\n"),
+                         ('c.nc', "G1 X40\n"))
+    assert rules(validator) == [('a.nc', 2, 'modal-laser')]
+
+
+def test_laser_leak_reported_again_after_new_m3():
+    validator = validate(('a.nc', "M3 S500\n"),
+                         ('b.nc', "M5\nM4 S200\n"))
+    assert rules(validator) == [('a.nc', 1, 'modal-laser'), ('b.nc', 2, 'modal-laser')]
+
+
+def test_findings_in_line_order_per_file():
+    validator = validate(('a.nc', "M3 S500\nG1 X10\nG1 X400\n"),
+                         ('b.nc', "G1 X500\nM5\n"),
+                         bed_width=300)
+    assert rules(validator) == [('a.nc', 1, 'modal-laser'), ('a.nc', 3, 'bed-bounds'),
+                                ('b.nc', 1, 'bed-bounds')]
+
+
+def test_program_end_resets_laser_and_distance_but_not_units():
+    validator = validate(('a.nc', "G20 G91\nM3 S500\nG1 X1\nM2\n"))
+    assert rules(validator) == [('a.nc', 4, 'modal-units')]
+    assert not validator.relative
+    assert validator.inches
+    assert validator.laser_on is None
+
+
+def test_relative_inch_moves_are_converted_to_mm():
+    validator = validate(('a.nc', "G0 X10 Y10\nG20 G91\nG1 X1 Y1\nG1 X3\nG21 G90\n"),
+                         bed_width=100, bed_height=100)
+    assert (validator.x, validator.y) == (10 + 4 * 25.4, 10 + 25.4)
+    assert rules(validator) == [('a.nc', 4, 'bed-bounds')]
+    assert validator.findings[0].message == "X111.6 is outside the bed (0 to 100)"
+
+
+def test_modal_state_warnings_at_end_of_file():
+    validator = validate(('a.nc', "G20\nG91\nG1 X0.1\n"))
+    assert rules(validator) == [('a.nc', 3, 'modal-distance'), ('a.nc', 3, 'modal-units')]
+
+
+def test_arc_extent_outside_bed():
+    # Full circle of radius 40 around X90 Y50 reaches X130
+    validator = validate(('a.nc', "G0 X50 Y50\nG2 X50 Y50 I40 J0\n"),
+                         bed_width=100, bed_height=100)
+    assert rules(validator) == [('a.nc', 2, 'bed-bounds')]
+    assert validator.findings[0].message == "X130 is outside the bed (0 to 100)"
+
+
+def test_radius_arc_extent_outside_bed():
+    # Clockwise half circle from X60 back to X50 dips to Y-5
+    validator = validate(('a.nc', "G0 X50 Y0\nG2 X60 Y0 R5\nG2 X50 Y0 R5\n"),
+                         bed_width=100, bed_height=100)
+    assert rules(validator) == [('a.nc', 3, 'bed-bounds')]
+
+
+def test_g92_offset_applies_to_bounds():
+    validator = validate(('a.nc', "G0 X50 Y50\nG92 X0 Y0\nG1 X40\nG1 X60\nG92.1\nG1 X60\n"),
+                         bed_width=100, bed_height=100)
+    assert rules(validator) == [('a.nc', 4, 'bed-bounds')]
+    assert validator.x == 60
+
+
+def test_power_feed_and_unsupported_commands():
+    validator = validate(('a.nc', "G1 X1 S1001 F100\nG1 X2 S1000 F7000\nG64\nM300 S440 P500\nM6\n"),
+                         max_power=1000, max_feed=6000)
+    assert rules(validator) == [('a.nc', 1, 'power-limit'), ('a.nc', 2, 'feed-limit'),
+                                ('a.nc', 3, 'unsupported-command'), ('a.nc', 5, 'unsupported-command')]
+
+
+def test_findings_capped_per_rule_with_overflow_message():
+    text = "".join(f"G1 X{400 + line} S0\n" for line in range(MAX_FINDINGS_PER_RULE + 5))
+    validator = validate(('a.nc', text), bed_width=300)
+    assert len(validator.findings) == MAX_FINDINGS_PER_RULE + 1
+    overflow = validator.findings[-1]
+    assert (overflow.line, overflow.severity, overflow.rule) == (MAX_FINDINGS_PER_RULE + 5, 'warning', 'bed-bounds')
+    assert overflow.message == "more occurrences not shown"
+
+
+def test_cap_is_per_file():
+    text = "".join(f"G1 X{400 + line}\n" for line in range(MAX_FINDINGS_PER_RULE))
+    validator = validate(('a.nc', text), ('b.nc', text), bed_width=300)
+    assert len(validator.findings) == 2 * MAX_FINDINGS_PER_RULE
+
+
+def test_comments_do_not_produce_words():
+    assert parse_line("(M3 S9999 X-5)\n") is EMPTY_LINE
+    assert parse_line("; G91 M3 S9999\n") is EMPTY_LINE
+    assert parse_line("G1 X5 (S9999) ; M3\n")[:4] == ([(1.0, '1')], [], 5.0, None)
+    assert parse_line("(part;1) G1 X500\n")[:4] == ([(1.0, '1')], [], 500.0, None)
+
+    validator = validate(('a.nc', "(Start of file: M3 S9999)\nG1 X10 ; G91 X-500 M3\n(end"),
+                         bed_width=100, max_power=1000)
+    assert validator.findings == []
+    assert validator.lines_checked == 3
+
+    validator = validate(('a.nc', "(part;1) G1 X500\n"), bed_width=100)
+    assert rules(validator) == [('a.nc', 1, 'bed-bounds')]
+
+
+def test_bulk_check_matches_line_by_line():
+    text = ("G21 G90\nM4 S0\n"
+            + "".join(f"G1 X{x}.5 Y{x % 200} S{x % 900}\n" for x in range(300))
+            + "G1 X300.5 S1000.5\nG1 X-0.2\nG0 X12\n"
+            + "".join(f"G1 X{x}.25 F{6000 + x % 2}\n" for x in range(40))
+            + "M5\n")
+    bulk = validate(('a.nc', text), bed_width=300, bed_height=200, max_power=1000, max_feed=6000)
+
+    line_by_line = GCodeValidator(bed_width=300, bed_height=200, max_power=1000, max_feed=6000)
+    line_by_line.start_file('a.nc')
+    lines = text.splitlines()
+    for line_number, line in enumerate(lines, 1):
+        line_by_line.check_line(line, line_number)
+    line_by_line.end_file(len(lines))
+
+    assert bulk.findings == line_by_line.findings
+    assert (bulk.x, bulk.y) == (line_by_line.x, line_by_line.y)
+    assert rules(bulk)[:3] == [('a.nc', 303, 'power-limit'), ('a.nc', 303, 'bed-bounds'),
+                               ('a.nc', 304, 'bed-bounds')]